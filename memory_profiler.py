@@ -46,6 +46,9 @@ except ImportError:
 
 _TWO_20 = float(2 ** 20)
 
+# .. psutil.Process objects are reused across samples, keyed by pid ..
+_process_cache = {}
+
 
 # .. get available packages ..
 try:
@@ -81,6 +84,19 @@ class MemitResult(object):
         p.text(u'<MemitResult : ' + msg + u'>')
 
 
+def _get_process(pid):
+    """
+    Returns a (cached) psutil.Process for pid.
+
+    Constructing a psutil.Process reads from /proc on every call, which
+    is wasteful when the same pid is sampled repeatedly.
+    """
+    process = _process_cache.get(pid)
+    if process is None:
+        process = _process_cache[pid] = psutil.Process(pid)
+    return process
+
+
 def _get_child_memory(process, meminfo_attr=None, memory_metric=0):
     """
     Returns a generator that yields memory for all child processes.
@@ -89,7 +105,7 @@ def _get_child_memory(process, meminfo_attr=None, memory_metric=0):
     if isinstance(process, int):
         if process == -1:
             process = os.getpid()
-        process = psutil.Process(process)
+        process = _get_process(process)
 
     if not meminfo_attr:
         # Use the psutil 2.0 attr if the older version isn't passed in.
@@ -108,105 +124,129 @@ def _get_child_memory(process, meminfo_attr=None, memory_metric=0):
             else:
                 child_mem = getattr(child, meminfo_attr)()[memory_metric]
             yield 0.0 if child_mem is None else child_mem / _TWO_20
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
+    except psutil.NoSuchProcess as e:
+        # .. only the parent's entry is cached; a child may exit mid-scan ..
+        if e.pid == process.pid:
+            _process_cache.pop(process.pid, None)
+        # https://github.com/fabianp/memory_profiler/issues/71
+        yield 0.0
+    except psutil.AccessDenied:
         # https://github.com/fabianp/memory_profiler/issues/71
         yield 0.0
 
 
-def _get_memory(pid, backend, timestamps=False, include_children=False, filename=None):
-    # .. low function to get memory consumption ..
-    if pid == -1:
-        pid = os.getpid()
+def _tracemalloc_tool(pid, timestamps, include_children, filename):
+    # .. cross-platform but but requires Python 3.4 or higher ..
+    stat = next(filter(lambda item: str(item).startswith(filename),
+                       tracemalloc.take_snapshot().statistics('filename')))
+    mem = stat.size / _TWO_20
+    if timestamps:
+        return mem, time.time()
+    else:
+        return mem
+
 
-    def tracemalloc_tool():
-        # .. cross-platform but but requires Python 3.4 or higher ..
-        stat = next(filter(lambda item: str(item).startswith(filename),
-                           tracemalloc.take_snapshot().statistics('filename')))
-        mem = stat.size / _TWO_20
+def _ps_util_tool(pid, timestamps, include_children, filename):
+    # .. cross-platform but but requires psutil ..
+    process = _get_process(pid)
+    try:
+        # avoid using get_memory_info since it does not exists
+        # in psutil > 2.0 and accessing it will cause exception.
+        meminfo_attr = 'memory_info' if hasattr(process, 'memory_info') \
+            else 'get_memory_info'
+        mem = getattr(process, meminfo_attr)()[0]
+        mem = -1 if mem is None else mem / _TWO_20
+        if include_children:
+            mem += sum(_get_child_memory(process, meminfo_attr))
         if timestamps:
             return mem, time.time()
         else:
             return mem
+    except psutil.NoSuchProcess:
+        _process_cache.pop(pid, None)
+        raise
+    except psutil.AccessDenied:
+        pass
+        # continue and try to get this from ps
 
-    def ps_util_tool():
-        # .. cross-platform but but requires psutil ..
-        process = psutil.Process(pid)
-        try:
-            # avoid using get_memory_info since it does not exists
-            # in psutil > 2.0 and accessing it will cause exception.
-            meminfo_attr = 'memory_info' if hasattr(process, 'memory_info') \
-                else 'get_memory_info'
-            mem = getattr(process, meminfo_attr)()[0]
-            mem = -1 if mem is None else mem / _TWO_20
-            if include_children:
-                mem += sum(_get_child_memory(process, meminfo_attr))
-            if timestamps:
-                return mem, time.time()
-            else:
-                return mem
-        except psutil.AccessDenied:
-            pass
-            # continue and try to get this from ps
 
-    def _ps_util_full_tool(memory_metric):
+def _ps_util_full_tool(memory_metric, pid, timestamps, include_children, filename):
 
-        # .. cross-platform but requires psutil > 4.0.0 ..
-        process = psutil.Process(pid)
-        try:
-            if not hasattr(process, 'memory_full_info'):
-                raise NotImplementedError("Backend `{}` requires psutil > 4.0.0".format(memory_metric))
+    # .. cross-platform but requires psutil > 4.0.0 ..
+    process = _get_process(pid)
+    try:
+        if not hasattr(process, 'memory_full_info'):
+            raise NotImplementedError("Backend `{}` requires psutil > 4.0.0".format(memory_metric))
+
+        meminfo_attr = 'memory_full_info'
+        meminfo = getattr(process, meminfo_attr)()
 
-            meminfo_attr = 'memory_full_info'
-            meminfo = getattr(process, meminfo_attr)()
+        if not hasattr(meminfo, memory_metric):
+            raise NotImplementedError(
+                "Metric `{}` not available. For details, see:".format(memory_metric) +
+                "https://psutil.readthedocs.io/en/latest/index.html?highlight=memory_info#psutil.Process.memory_full_info")
+        mem = getattr(meminfo, memory_metric)
+        mem = -1 if mem is None else mem / _TWO_20
 
-            if not hasattr(meminfo, memory_metric):
-                raise NotImplementedError(
-                    "Metric `{}` not available. For details, see:".format(memory_metric) +
-                    "https://psutil.readthedocs.io/en/latest/index.html?highlight=memory_info#psutil.Process.memory_full_info")
-            mem = getattr(meminfo, memory_metric)
-            mem = -1 if mem is None else mem / _TWO_20
+        if include_children:
+            mem += sum(_get_child_memory(process, meminfo_attr, memory_metric))
 
-            if include_children:
-                mem += sum(_get_child_memory(process, meminfo_attr, memory_metric))
+        if timestamps:
+            return mem, time.time()
+        else:
+            return mem
 
-            if timestamps:
-                return mem, time.time()
-            else:
-                return mem
+    except psutil.NoSuchProcess:
+        _process_cache.pop(pid, None)
+        raise
+    except psutil.AccessDenied:
+        pass
+        # continue and try to get this from ps
+
+
+def _posix_tool(pid, timestamps, include_children, filename):
+    # .. scary stuff ..
+    if include_children:
+        raise NotImplementedError((
+            "The psutil module is required to monitor the "
+            "memory usage of child processes."
+        ))
+
+    warnings.warn("psutil module not found. memory_profiler will be slow")
+    # ..
+    # .. memory usage in MiB ..
+    # .. this should work on both Mac and Linux ..
+    # .. subprocess.check_output appeared in 2.7, using Popen ..
+    # .. for backwards compatibility ..
+    out = subprocess.Popen(['ps', 'v', '-p', str(pid)],
+                           stdout=subprocess.PIPE
+                           ).communicate()[0].split(b'\n')
+    try:
+        vsz_index = out[0].split().index(b'RSS')
+        mem = float(out[1].split()[vsz_index]) / 1024
+        if timestamps:
+            return mem, time.time()
+        else:
+            return mem
+    except Exception:
+        if timestamps:
+            return -1, time.time()
+        else:
+            return -1
 
-        except psutil.AccessDenied:
-            pass
-            # continue and try to get this from ps
 
-    def posix_tool():
-        # .. scary stuff ..
-        if include_children:
-            raise NotImplementedError((
-                "The psutil module is required to monitor the "
-                "memory usage of child processes."
-            ))
-
-        warnings.warn("psutil module not found. memory_profiler will be slow")
-        # ..
-        # .. memory usage in MiB ..
-        # .. this should work on both Mac and Linux ..
-        # .. subprocess.check_output appeared in 2.7, using Popen ..
-        # .. for backwards compatibility ..
-        out = subprocess.Popen(['ps', 'v', '-p', str(pid)],
-                               stdout=subprocess.PIPE
-                               ).communicate()[0].split(b'\n')
-        try:
-            vsz_index = out[0].split().index(b'RSS')
-            mem = float(out[1].split()[vsz_index]) / 1024
-            if timestamps:
-                return mem, time.time()
-            else:
-                return mem
-        except Exception:
-            if timestamps:
-                return -1, time.time()
-            else:
-                return -1
+# .. built once at import time rather than on every sample ..
+_memory_tools = {'tracemalloc': _tracemalloc_tool,
+                 'psutil': _ps_util_tool,
+                 'psutil_pss': partial(_ps_util_full_tool, "pss"),
+                 'psutil_uss': partial(_ps_util_full_tool, "uss"),
+                 'posix': _posix_tool}
+
+
+def _get_memory(pid, backend, timestamps=False, include_children=False, filename=None):
+    # .. low function to get memory consumption ..
+    if pid == -1:
+        pid = os.getpid()
 
     if backend == 'tracemalloc' and \
             (filename is None or filename == '<unknown>'):
@@ -214,12 +254,7 @@ def _get_memory(pid, backend, timestamps=False, include_children=False, filename
             'There is no access to source file of the profiled function'
         )
 
-    tools = {'tracemalloc': tracemalloc_tool,
-             'psutil': ps_util_tool,
-             'psutil_pss': lambda: _ps_util_full_tool(memory_metric="pss"),
-             'psutil_uss': lambda: _ps_util_full_tool(memory_metric="uss"),
-             'posix': posix_tool}
-    return tools[backend]()
+    return _memory_tools[backend](pid, timestamps, include_children, filename)
 
 
 class MemTimer(Process):
@@ -380,7 +415,8 @@ def memory_usage(proc=-1, interval=.1, timeout=None, timestamps=False,
                 returned = f(*args, **kw)
                 parent_conn.send(0)  # finish timing
                 handles = mp_conn.wait([p.sentinel, parent_conn])
-                if p.sentinel in handles:
+                # .. the child may already have exited after sending its results ..
+                if parent_conn not in handles:
                     raise RuntimeError("MemTimer child died")
                 ret = parent_conn.recv()
                 n_measurements = parent_conn.recv()
@@ -404,81 +440,89 @@ def memory_usage(proc=-1, interval=.1, timeout=None, timestamps=False,
     elif isinstance(proc, subprocess.Popen):
         # external process, launched from Python
         line_count = 0
-        while True:
-            if not max_usage:
-                mem_usage = _get_memory(
-                    proc.pid, backend, timestamps=timestamps,
-                    include_children=include_children)
-
-                if mem_usage and stream is not None:
-                    stream.write("MEM {0:.6f} {1:.4f}\n".format(*mem_usage))
-
-                    # Write children to the stream file
-                    if multiprocess:
-                        for idx, chldmem in enumerate(_get_child_memory(proc.pid)):
-                            stream.write("CHLD {0} {1:.6f} {2:.4f}\n".format(idx, chldmem, time.time()))
+        try:
+            while True:
+                if not max_usage:
+                    mem_usage = _get_memory(
+                        proc.pid, backend, timestamps=timestamps,
+                        include_children=include_children)
+
+                    if mem_usage and stream is not None:
+                        stream.write("MEM {0:.6f} {1:.4f}\n".format(*mem_usage))
+
+                        # Write children to the stream file
+                        if multiprocess:
+                            for idx, chldmem in enumerate(_get_child_memory(proc.pid)):
+                                stream.write("CHLD {0} {1:.6f} {2:.4f}\n".format(idx, chldmem, time.time()))
+                    else:
+                        # Create a nested list with the child memory
+                        if multiprocess:
+                            mem_usage = [mem_usage]
+                            for chldmem in _get_child_memory(proc.pid):
+                                mem_usage.append(chldmem)
+
+                        # Append the memory usage to the return value
+                        ret.append(mem_usage)
                 else:
-                    # Create a nested list with the child memory
-                    if multiprocess:
-                        mem_usage = [mem_usage]
-                        for chldmem in _get_child_memory(proc.pid):
-                            mem_usage.append(chldmem)
-
-                    # Append the memory usage to the return value
-                    ret.append(mem_usage)
-            else:
-                ret = max(ret,
-                          _get_memory(
-                              proc.pid, backend, include_children=include_children))
-            time.sleep(interval)
-            line_count += 1
-            # flush every 50 lines. Make 'tail -f' usable on profile file
-            if line_count > 50:
-                line_count = 0
-                if stream is not None:
-                    stream.flush()
-            if timeout is not None:
-                max_iter -= 1
-                if max_iter == 0:
+                    ret = max(ret,
+                              _get_memory(
+                                  proc.pid, backend, include_children=include_children))
+                time.sleep(interval)
+                line_count += 1
+                # flush every 50 lines. Make 'tail -f' usable on profile file
+                if line_count > 50:
+                    line_count = 0
+                    if stream is not None:
+                        stream.flush()
+                if timeout is not None:
+                    max_iter -= 1
+                    if max_iter == 0:
+                        break
+                if proc.poll() is not None:
                     break
-            if proc.poll() is not None:
-                break
+        finally:
+            # .. the pid may be reused once the process exits ..
+            _process_cache.pop(proc.pid, None)
     else:
         # external process
         if max_iter == -1:
             max_iter = 1
         counter = 0
-        while counter < max_iter:
-            counter += 1
-            if not max_usage:
-                mem_usage = _get_memory(
-                    proc, backend, timestamps=timestamps,
-                    include_children=include_children)
-                if stream is not None:
-                    stream.write("MEM {0:.6f} {1:.4f}\n".format(*mem_usage))
-
-                    # Write children to the stream file
-                    if multiprocess:
-                        for idx, chldmem in enumerate(_get_child_memory(proc)):
-                            stream.write("CHLD {0} {1:.6f} {2:.4f}\n".format(idx, chldmem, time.time()))
+        try:
+            while counter < max_iter:
+                counter += 1
+                if not max_usage:
+                    mem_usage = _get_memory(
+                        proc, backend, timestamps=timestamps,
+                        include_children=include_children)
+                    if stream is not None:
+                        stream.write("MEM {0:.6f} {1:.4f}\n".format(*mem_usage))
+
+                        # Write children to the stream file
+                        if multiprocess:
+                            for idx, chldmem in enumerate(_get_child_memory(proc)):
+                                stream.write("CHLD {0} {1:.6f} {2:.4f}\n".format(idx, chldmem, time.time()))
+                    else:
+                        # Create a nested list with the child memory
+                        if multiprocess:
+                            mem_usage = [mem_usage]
+                            for chldmem in _get_child_memory(proc):
+                                mem_usage.append(chldmem)
+
+                        # Append the memory usage to the return value
+                        ret.append(mem_usage)
                 else:
-                    # Create a nested list with the child memory
-                    if multiprocess:
-                        mem_usage = [mem_usage]
-                        for chldmem in _get_child_memory(proc):
-                            mem_usage.append(chldmem)
-
-                    # Append the memory usage to the return value
-                    ret.append(mem_usage)
-            else:
-                ret = max([ret,
-                           _get_memory(proc, backend, include_children=include_children)
-                           ])
-
-            time.sleep(interval)
-            # Flush every 50 lines.
-            if counter % 50 == 0 and stream is not None:
-                stream.flush()
+                    ret = max([ret,
+                               _get_memory(proc, backend, include_children=include_children)
+                               ])
+
+                time.sleep(interval)
+                # Flush every 50 lines.
+                if counter % 50 == 0 and stream is not None:
+                    stream.flush()
+        finally:
+            # .. the pid may be reused once the process exits ..
+            _process_cache.pop(os.getpid() if proc == -1 else proc, None)
     if stream:
         return None
     return ret
@@ -677,14 +721,15 @@ class CodeMap(dict):
     def trace(self, code, lineno, prev_lineno):
         memory = _get_memory(-1, self.backend, include_children=self.include_children,
                              filename=code.co_filename)
-        prev_value = self[code].get(lineno, None)
+        measures = self[code]
+        prev_value = measures.get(lineno, None)
         previous_memory = prev_value[1] if prev_value else 0
         previous_inc = prev_value[0] if prev_value else 0
 
-        prev_line_value = self[code].get(prev_lineno, None) if prev_lineno else None
+        prev_line_value = measures.get(prev_lineno, None) if prev_lineno else None
         prev_line_memory = prev_line_value[1] if prev_line_value else 0
-        occ_count = self[code][lineno][2] + 1 if lineno in self[code] else 1
-        self[code][lineno] = (
+        occ_count = prev_value[2] + 1 if prev_value else 1
+        measures[lineno] = (
             previous_inc + (memory - prev_line_memory),
             max(memory, previous_memory),
             occ_count,
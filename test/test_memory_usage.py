@@ -1,5 +1,10 @@
-from memory_profiler import memory_usage
+from memory_profiler import (memory_usage, _get_memory, _get_child_memory,
+                             _get_process, _process_cache)
 import os
+import subprocess
+import sys
+
+import psutil
 
 
 def some_func(*args, **kwargs):
@@ -40,7 +45,81 @@ def test_return_value_consistency():
     assert type(func_mem_max) == float, "Max memory usage of callable should be a number"
 
 
+def test_process_cache():
+    # Check that repeated samples of the same pid reuse the psutil.Process
+    pid = os.getpid()
+    _get_memory(pid, 'psutil')
+    process = _process_cache[pid]
+    _get_memory(pid, 'psutil')
+    assert _process_cache[pid] is process
+
+
+def test_process_cache_evicted_after_exit():
+    # Check that a measured subprocess does not stay in the cache once it exits
+    proc = subprocess.Popen([sys.executable, '-c', 'pass'])
+    memory_usage(proc, interval=0.01)
+    proc.wait()
+    assert proc.pid not in _process_cache
+
+
+def test_process_cache_evicted_after_pid_sampling():
+    # Check that sampling an external pid does not leave it in the cache
+    proc = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(10)'])
+    try:
+        memory_usage(proc.pid, multiprocess=True)
+        assert proc.pid not in _process_cache
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_process_cache_evicted_on_dead_pid():
+    # Check that sampling a pid that has gone away raises and drops the entry
+    proc = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(10)'])
+    _get_memory(proc.pid, 'psutil')
+    assert proc.pid in _process_cache
+    proc.kill()
+    proc.wait()
+    try:
+        _get_memory(proc.pid, 'psutil')
+    except psutil.NoSuchProcess:
+        pass
+    else:
+        assert False, "Sampling a dead pid should raise NoSuchProcess"
+    assert proc.pid not in _process_cache
+
+
+def test_child_memory_evicts_dead_pid():
+    # Check that _get_child_memory drops a cached pid whose process is gone
+    proc = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(10)'])
+    list(_get_child_memory(proc.pid))
+    assert proc.pid in _process_cache
+    proc.kill()
+    proc.wait()
+    assert list(_get_child_memory(proc.pid)) == [0.0]
+    assert proc.pid not in _process_cache
+
+    # A child exiting mid-scan must not evict its live parent
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(10)'])
+    dead_child = psutil.Process(child.pid)
+    child.kill()
+    child.wait()
+    pid = os.getpid()
+    parent = _get_process(pid)
+    parent.children = lambda recursive=False: [dead_child]
+    try:
+        assert list(_get_child_memory(pid)) == [0.0]
+    finally:
+        del parent.children
+    assert _process_cache[pid] is parent
+
+
 if __name__ == "__main__":
     test_memory_usage()
     test_max_iterations()
     test_return_value_consistency()
+    test_process_cache()
+    test_process_cache_evicted_after_exit()
+    test_process_cache_evicted_after_pid_sampling()
+    test_process_cache_evicted_on_dead_pid()
+    test_child_memory_evicts_dead_pid()